@@ -0,0 +1,114 @@
+import argparse
+import os
+import tempfile
+import time
+import timeit
+
+import numpy as np
+import pandas as pd
+
+from data_model import load_day_frame, compact_dtypes
+from stations import discover_shards, ingest_stations
+
+# Operasi yang sama dengan yang dijalankan dashboard pada setiap interaksi filter
+OPERATIONS = {
+    'filter isin': lambda df: df[
+        df['season'].isin(['spring', 'summer', 'fall']) &
+        df['weather_condition'].isin(['clear', 'mist']) &
+        (df['day_type'] == 'weekday')
+    ],
+    'groupby season mean': lambda df: df.groupby('season', observed=True)['count'].mean(),
+    'groupby weather agg': lambda df: df.groupby('weather_condition', observed=True).agg({
+        'count': ['max', 'min', 'mean', 'sum'], 'casual': 'mean', 'registered': 'mean'
+    }),
+    'groupby weekday mean': lambda df: df.groupby('weekday', observed=True)['count'].mean(),
+    'value_counts Segment': lambda df: df['Segment'].value_counts(sort=False),
+    'groupby Segment agg': lambda df: df.groupby('Segment', observed=True).agg({
+        'count': ['mean', 'min', 'max'], 'Recency': 'mean',
+        'R_Score': 'mean', 'F_Score': 'mean', 'M_Score': 'mean'
+    }),
+}
+
+
+def best_time(func, df, repeat, number):
+    return min(timeit.repeat(lambda: func(df), repeat=repeat, number=number)) / number
+
+
+def run(path, scale, repeat, number):
+    object_df = load_day_frame(path, compact=False)
+    if scale > 1:
+        # Perbesar data agar perbedaan tidak tertutup overhead per pemanggilan
+        object_df = pd.concat([object_df] * scale, ignore_index=True)
+    compact_df = compact_dtypes(object_df.copy())
+
+    object_mem = object_df.memory_usage(deep=True).sum()
+    compact_mem = compact_df.memory_usage(deep=True).sum()
+    print(f"Baris: {len(object_df):,}")
+    print(f"Memori object  : {object_mem / 1024:,.1f} KiB")
+    print(f"Memori compact : {compact_mem / 1024:,.1f} KiB ({object_mem / compact_mem:.1f}x lebih kecil)")
+    print()
+    print(f"{'Operasi':<24}{'object (ms)':>14}{'compact (ms)':>14}{'speedup':>10}")
+    for name, func in OPERATIONS.items():
+        object_time = best_time(func, object_df, repeat, number) * 1000
+        compact_time = best_time(func, compact_df, repeat, number) * 1000
+        print(f"{name:<24}{object_time:>14.3f}{compact_time:>14.3f}{object_time / compact_time:>9.1f}x")
+
+
+def make_station_shards(path, n_stations, out_dir, n_cities=4, seed=0):
+    """Buat data sintetis n stasiun dari dataset bawaan dengan skala permintaan acak."""
+    base = pd.read_csv(path)
+    rng = np.random.default_rng(seed)
+    for i in range(n_stations):
+        scale = rng.uniform(0.05, 1.0)
+        shard = base.copy()
+        shard['casual'] = np.round(shard['casual'] * scale).astype(int)
+        shard['registered'] = np.round(shard['registered'] * scale).astype(int)
+        shard['count'] = shard['casual'] + shard['registered']
+
+        city_dir = os.path.join(out_dir, 'stations', f'city_{i % n_cities}')
+        os.makedirs(city_dir, exist_ok=True)
+        shard.to_csv(os.path.join(city_dir, f'station_{i:04d}.csv'), index=False)
+    return discover_shards(out_dir)
+
+
+def run_stations(path, n_stations, workers):
+    with tempfile.TemporaryDirectory() as out_dir:
+        shards = make_station_shards(path, n_stations, out_dir)
+
+        print(f"Stasiun: {n_stations} ({n_stations * len(pd.read_csv(path)):,} baris stasiun-hari)")
+        print(f"{'Worker':<8}{'ingest (s)':>12}{'speedup':>10}")
+        baseline = None
+        for max_workers in workers:
+            start = time.perf_counter()
+            station_data = ingest_stations(shards, max_workers=max_workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{max_workers:<8}{elapsed:>12.2f}{baseline / elapsed:>9.1f}x")
+
+        cube_sizes = {name: (len(cube), cube.memory_usage(deep=True).sum())
+                      for name, cube in station_data['cubes'].items()}
+        print(f"{'Cube':<24}{'baris':>8}{'KiB':>10}")
+        for name, (rows, mem) in cube_sizes.items():
+            print(f"{name:<24}{rows:>8,}{mem / 1024:>10,.1f}")
+
+        cube_mem = sum(mem for _, mem in cube_sizes.values())
+        frame_mem = load_day_frame(shards[0].path).memory_usage(deep=True).sum() * n_stations
+        print(f"Memori partial aggregate : {cube_mem / 1024:,.1f} KiB")
+        print(f"Memori frame harian      : {frame_mem / 1024:,.1f} KiB (jika semua stasiun dimuat)")
+        print(f"Rasio partial / frame    : {cube_mem / frame_mem:.2f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark representasi dtype data dashboard")
+    parser.add_argument('--path', default='clean_bike_rental_day.csv')
+    parser.add_argument('--scale', type=int, default=1, help="Jumlah replikasi baris dataset")
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--number', type=int, default=20)
+    parser.add_argument('--stations', type=int, default=0,
+                        help="Jika > 0, benchmark ingest sharded untuk n stasiun sintetis")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+    if args.stations:
+        run_stations(args.path, args.stations, args.workers)
+    else:
+        run(args.path, args.scale, args.repeat, args.number)
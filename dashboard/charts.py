@@ -0,0 +1,234 @@
+import io
+
+import numpy as np
+import matplotlib.pyplot as plt
+import seaborn as sns
+from matplotlib.figure import Figure
+
+# Semua chart dibuat dengan objek Figure (bukan state global pyplot) agar aman
+# dirender dari thread warm-up maupun dari sesi Streamlit secara bersamaan.
+
+
+def _style_axes(ax, title, xlabel, ylabel, title_size=14, label_size=12, pad=20):
+    ax.set_title(title, fontsize=title_size, pad=pad)
+    ax.set_xlabel(xlabel, fontsize=label_size)
+    ax.set_ylabel(ylabel, fontsize=label_size)
+    ax.grid(axis='y', linestyle='--', alpha=0.7)
+    ax.set_axisbelow(True)
+
+
+def _label_bars(ax, bars, offset, fontsize, fontweight='bold'):
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width()/2., height + offset,
+                f'{int(height)}', ha='center', va='bottom', fontsize=fontsize, fontweight=fontweight)
+
+
+def season_avg_chart(views):
+    seasonal_avg_rentals = views['seasonal_avg_rentals']
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    colors = plt.cm.viridis(np.linspace(0.2, 0.9, 4))
+    bars = ax.bar(seasonal_avg_rentals['season_display'], seasonal_avg_rentals['count'], color=colors)
+
+    _style_axes(ax, 'Rata-rata Jumlah Penyewaan Sepeda Berdasarkan Musim',
+                'Musim', 'Rata-rata Jumlah Penyewaan')
+    _label_bars(ax, bars, 50, 10)
+
+    fig.tight_layout()
+    return fig
+
+
+def season_box_chart(views):
+    # Statistik box dihitung dari histogram aditif (lihat data_model._box_stats)
+    box_stats = views['season_box']
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+
+    # Filter yang mengosongkan data menghasilkan axes kosong, bukan error
+    if box_stats:
+        line = {'color': '0.25'}
+        boxes = ax.bxp(box_stats, patch_artist=True, widths=0.8, medianprops=line,
+                       whiskerprops=line, capprops=line,
+                       flierprops={'marker': 'd', 'markerfacecolor': '0.25'})
+        for patch, color in zip(boxes['boxes'], sns.color_palette('viridis', len(box_stats))):
+            patch.set_facecolor(color)
+            patch.set_edgecolor('0.25')
+
+    _style_axes(ax, 'Distribusi Jumlah Penyewaan Sepeda Berdasarkan Musim',
+                'Musim', 'Jumlah Penyewaan')
+
+    fig.tight_layout()
+    return fig
+
+
+def weather_avg_chart(views):
+    weather_avg_rentals = views['weather_avg_rentals']
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(weather_avg_rentals)))
+    bars = ax.bar(weather_avg_rentals['weather_display'], weather_avg_rentals['count'], color=colors)
+
+    _style_axes(ax, 'Rata-rata Jumlah Penyewaan Sepeda Berdasarkan Kondisi Cuaca',
+                'Kondisi Cuaca', 'Rata-rata Jumlah Penyewaan')
+    _label_bars(ax, bars, 50, 10)
+
+    fig.tight_layout()
+    return fig
+
+
+def weather_user_chart(views):
+    weather_user = views['weather_user']
+
+    fig = Figure(figsize=(12, 7))
+    ax = fig.subplots()
+
+    x = np.arange(len(weather_user))
+    width = 0.35
+
+    bars1 = ax.bar(x - width/2, weather_user['casual'], width,
+                   label='Casual', color='skyblue', edgecolor='black', linewidth=0.5)
+    bars2 = ax.bar(x + width/2, weather_user['registered'], width,
+                   label='Registered', color='teal', edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Rata-rata Jumlah Penyewaan Sepeda (Casual vs Registered) Berdasarkan Kondisi Cuaca',
+                'Kondisi Cuaca', 'Rata-rata Jumlah Penyewaan')
+    ax.set_xticks(x)
+    ax.set_xticklabels(weather_user['weather_display'])
+    ax.legend()
+
+    # Tambahkan nilai di atas bar
+    for bars in [bars1, bars2]:
+        for bar in bars:
+            height = bar.get_height()
+            if height > 0:
+                ax.text(bar.get_x() + bar.get_width()/2., height + 20,
+                        f'{int(height)}', ha='center', va='bottom', fontsize=9)
+
+    fig.tight_layout()
+    return fig
+
+
+def day_type_chart(views):
+    day_type_avg = views['day_type_avg']
+
+    fig = Figure(figsize=(8, 6))
+    ax = fig.subplots()
+    colors = ['#FF6B6B', '#4ECDC4']
+    bars = ax.bar(day_type_avg['day_display'], day_type_avg['count'], color=colors,
+                  edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Rata-rata Jumlah Penyewaan Sepeda: Hari Kerja vs Akhir Pekan',
+                'Tipe Hari', 'Rata-rata Jumlah Penyewaan')
+    _label_bars(ax, bars, 20, 12)
+
+    fig.tight_layout()
+    return fig
+
+
+def weekday_chart(views):
+    weekday_avg = views['weekday_avg']
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    colors = plt.cm.Paired(np.linspace(0.1, 0.9, 7))
+    ax.bar(weekday_avg['day_display'], weekday_avg['count'], color=colors,
+           edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Rata-rata Jumlah Penyewaan Sepeda per Hari', 'Hari', 'Rata-rata Jumlah Penyewaan')
+
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    return fig
+
+
+def segment_chart(views):
+    segment_counts = views['segment_counts']
+
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
+    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(segment_counts)))
+    bars = ax.bar(segment_counts['Segment'], segment_counts['Jumlah'], color=colors,
+                  edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Distribusi Hari di Seluruh Segmen RFM', 'Segmen RFM', 'Jumlah Hari')
+    _label_bars(ax, bars, 1, 10)
+
+    plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
+    fig.tight_layout()
+    return fig
+
+
+def temp_category_chart(views):
+    temp_counts = views['temp_counts']
+
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    colors = ['#ADD8E6', '#90EE90', '#FFD700', '#FFA07A']
+    bars = ax.bar(temp_counts['Kategori'], temp_counts['Jumlah'], color=colors,
+                  edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Distribusi Hari Berdasarkan Kategori Suhu', 'Kategori Suhu', 'Jumlah Hari',
+                title_size=12, label_size=10, pad=15)
+    _label_bars(ax, bars, 1, 9)
+
+    fig.tight_layout()
+    return fig
+
+
+def hum_category_chart(views):
+    hum_counts = views['hum_counts']
+
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    colors = ['#87CEEB', '#4682B4', '#2E5984']
+    bars = ax.bar(hum_counts['display'], hum_counts['Jumlah'], color=colors,
+                  edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Distribusi Hari Berdasarkan Kategori Kelembaban', 'Kategori Kelembaban', 'Jumlah Hari',
+                title_size=12, label_size=10, pad=15)
+    _label_bars(ax, bars, 1, 9)
+
+    fig.tight_layout()
+    return fig
+
+
+def rental_category_chart(views):
+    rental_counts = views['rental_counts']
+
+    fig = Figure(figsize=(8, 5))
+    ax = fig.subplots()
+    colors = plt.cm.Reds(np.linspace(0.3, 0.9, 4))
+    bars = ax.bar(rental_counts['display'], rental_counts['Jumlah'], color=colors,
+                  edgecolor='black', linewidth=0.5)
+
+    _style_axes(ax, 'Distribusi Hari Berdasarkan Kategori Volume Penyewaan', 'Kategori Volume', 'Jumlah Hari',
+                title_size=12, label_size=10, pad=15)
+    _label_bars(ax, bars, 1, 9)
+
+    fig.tight_layout()
+    return fig
+
+
+CHARTS = {
+    'season_avg': season_avg_chart,
+    'season_box': season_box_chart,
+    'weather_avg': weather_avg_chart,
+    'weather_user': weather_user_chart,
+    'day_type': day_type_chart,
+    'weekday': weekday_chart,
+    'segment': segment_chart,
+    'temp_category': temp_category_chart,
+    'hum_category': hum_category_chart,
+    'rental_category': rental_category_chart,
+}
+
+
+def render_png(fig):
+    # Opsi savefig sama dengan default st.pyplot agar hasil pre-render identik
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', bbox_inches='tight', dpi=200)
+    return buffer.getvalue()
@@ -1,10 +1,10 @@
 import streamlit as st
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-from datetime import datetime
+import time
 import warnings
+from charts import CHARTS
+from data_model import build_views, select_partials, season_order, weather_order
+from warmup import start_warmup
+from weather_model import FEATURE_SCALE, SEASONS, WEATHERS, WEEKDAYS
 warnings.filterwarnings('ignore')
 
 # Konfigurasi halaman
@@ -15,76 +15,18 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Load data
-@st.cache_data
-def load_data():
-    df_day = pd.read_csv('clean_bike_rental_day.csv')
-    df_day['dateday'] = pd.to_datetime(df_day['dateday'])
-    
-    # Hitung Recency (tanggal terbaru dalam dataset)
-    current_date = df_day['dateday'].max()
-    df_day['Recency'] = (current_date - df_day['dateday']).dt.days
-    
-    # Buat R_Score (5 = paling baru, 1 = paling lama)
-    df_day['R_Score'] = pd.qcut(df_day['Recency'], 5, labels=False, duplicates='drop')
-    df_day['R_Score'] = 5 - df_day['R_Score']
-    
-    # Buat F_Score dan M_Score (berdasarkan count)
-    df_day['F_Score'] = pd.qcut(df_day['count'], 5, labels=False, duplicates='drop') + 1
-    df_day['M_Score'] = pd.qcut(df_day['count'], 5, labels=False, duplicates='drop') + 1
-    
-    # Buat RFM_Score gabungan
-    df_day['RFM_Score'] = df_day['R_Score'].astype(str) + df_day['F_Score'].astype(str) + df_day['M_Score'].astype(str)
-    
-    # Fungsi untuk menentukan segment
-    def rfm_segment(row):
-        r_score = row['R_Score']
-        f_score = row['F_Score']
-        m_score = row['M_Score']
-        
-        if r_score >= 4 and f_score >= 4 and m_score >= 4:
-            return 'Best Days'
-        elif r_score >= 3 and f_score >= 3 and m_score >= 3:
-            return 'Good Days'
-        elif r_score >= 2 and f_score >= 2 and m_score >= 2:
-            return 'Regular Days'
-        elif r_score <= 2 and f_score >= 3 and m_score >= 3:
-            return 'Needs Attention'
-        else:
-            return 'Lost Days'
-    
-    df_day['Segment'] = df_day.apply(rfm_segment, axis=1)
-    
-    # Kategori suhu
-    df_day['temp_category'] = pd.cut(
-        df_day['temperature'],
-        bins=[0, 0.2, 0.5, 0.7, 1.0],
-        labels=['Cold', 'Mild', 'Warm', 'Hot'],
-        include_lowest=True
-    )
-    
-    # Kategori kelembaban
-    df_day['hum_category'] = pd.cut(
-        df_day['humadity'],
-        bins=[0, 0.33, 0.66, 1.0],
-        labels=['Low Humidity', 'Medium Humidity', 'High Humidity'],
-        include_lowest=True
-    )
-    
-    # Kategori volume penyewaan
-    rental_bins = df_day['count'].quantile([0, 0.25, 0.5, 0.75, 1]).tolist()
-    rental_labels = ['Low Rentals', 'Medium Rentals', 'High Rentals', 'Very High Rentals']
-    
-    df_day['rental_volume_category'] = pd.cut(
-        df_day['count'],
-        bins=rental_bins,
-        labels=rental_labels,
-        include_lowest=True
-    )
-    
-    return df_day
+# Warm-up dijalankan sekali per proses server: ingest per stasiun, agregat, dan pre-render
+# chart tampilan default berjalan di background sehingga sesi tidak menunggu semuanya.
+# Jika server dijalankan lewat run_dashboard.py, warm-up sudah mulai sebelum sesi pertama.
+# Warm-up yang gagal dimulai ulang oleh start_warmup pada sesi berikutnya.
+warmup = start_warmup()
 
-df = load_data()
+with st.spinner("Memuat data..."):
+    station_data = warmup.data.result()
+
+# Dashboard hanya menyimpan partial aggregate per stasiun, bukan data harian mentah
+cubes = station_data['cubes']
+station_list = station_data['stations']
 
 # Sidebar - Profil dan Filter
 with st.sidebar:
@@ -100,8 +42,27 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 🎯 Filter Data")
     
+    # Filter Kota
+    cities = station_list['city'].unique().tolist()
+    selected_cities = st.multiselect(
+        "Kota",
+        options=cities,
+        default=cities
+    )
+    
+    # Filter Stasiun (hanya stasiun di kota terpilih), dikunci (kota, stasiun)
+    # karena nama stasiun yang sama bisa ada di kota berbeda
+    stations = list(station_list.loc[station_list['city'].isin(selected_cities), ['city', 'station']]
+                    .itertuples(index=False, name=None))
+    selected_stations = st.multiselect(
+        "Stasiun",
+        options=stations,
+        format_func=lambda x: f"{x[0]} / {x[1]}",
+        default=stations
+    )
+    
     # Filter Tahun
-    years = df['year'].unique()
+    years = cubes['base']['year'].unique().tolist()
     selected_years = st.multiselect(
         "Tahun",
         options=sorted(years),
@@ -109,7 +70,7 @@ with st.sidebar:
     )
     
     # Filter Musim
-    seasons = df['season'].unique()
+    seasons = season_order
     season_names = {
         'spring': 'Spring', 
         'summer': 'Summer', 
@@ -124,7 +85,7 @@ with st.sidebar:
     )
     
     # Filter Cuaca
-    weather = df['weather_condition'].unique()
+    weather = weather_order
     weather_names = {
         'clear': 'Clear',
         'mist': 'Mist',
@@ -146,37 +107,61 @@ with st.sidebar:
     st.markdown("---")
     st.markdown("### 📊 Tentang Dataset")
     st.markdown(f"""
-    - **Total Data:** {len(df)} hari
-    - **Periode:** {df['dateday'].min().strftime('%d %b %Y')} - {df['dateday'].max().strftime('%d %b %Y')}
-    - **Rata-rata Penyewaan:** {df['count'].mean():.0f}/hari
+    - **Stasiun:** {len(station_list)} stasiun di {len(cities)} kota
+    - **Total Data:** {cubes['base']['n'].sum()} hari
+    - **Periode:** {station_data['date_min'].strftime('%d %b %Y')} - {station_data['date_max'].strftime('%d %b %Y')}
+    - **Rata-rata Penyewaan:** {cubes['base']['count_sum'].sum() / cubes['base']['n'].sum():.0f}/hari
     """)
 
-# Apply filter
-filtered_df = df[
-    (df['year'].isin(selected_years)) &
-    (df['season'].isin(selected_seasons)) &
-    (df['weather_condition'].isin(selected_weather))
-]
+# Apply filter pada partial aggregate (digabung ulang untuk subset stasiun terpilih)
+selected_cubes = select_partials(
+    cubes,
+    cities=selected_cities,
+    stations=selected_stations,
+    years=selected_years,
+    seasons=selected_seasons,
+    weather=selected_weather,
+    day_type={'Weekday': 'weekday', 'Weekend': 'weekend'}.get(day_type)
+)
+
+# Tampilan default (semua filter terpilih) memakai agregat & chart hasil warm-up
+is_default_view = (
+    set(selected_cities) == set(cities) and
+    set(selected_stations) == set(stations) and
+    set(selected_years) == set(years) and
+    set(selected_seasons) == set(seasons) and
+    set(selected_weather) == set(weather) and
+    day_type == 'Semua'
+)
+views = warmup.views.result() if is_default_view else build_views(selected_cubes)
 
-if day_type == 'Weekday':
-    filtered_df = filtered_df[filtered_df['day_type'] == 'weekday']
-elif day_type == 'Weekend':
-    filtered_df = filtered_df[filtered_df['day_type'] == 'weekend']
+def show_chart(name):
+    # Chart yang belum selesai di-pre-render langsung dirender di sesi ini
+    png = warmup.chart_png(name) if is_default_view else None
+    if png is not None:
+        st.image(png, width='stretch')
+    else:
+        st.pyplot(CHARTS[name](views))
 
 # Header
 st.title("🚴‍♂️ Proyek Analisis Data: Bike Sharing")
+if warmup.done and warmup.failed:
+    st.warning("⚠️ Sebagian warm-up gagal, chart dirender langsung dan warm-up akan diulang.")
+elif not warmup.ready.is_set():
+    st.progress(warmup.progress, text="⏳ Menyiapkan dashboard, sebagian chart dirender langsung...")
 st.markdown("---")
 
 # Metrics Row
+metrics = views['metrics']
 col1, col2, col3, col4 = st.columns(4)
 with col1:
-    st.metric("📅 Total Hari", f"{len(filtered_df):,}")
+    st.metric("📅 Total Hari", f"{metrics['days']:,}")
 with col2:
-    st.metric("🚲 Total Penyewaan", f"{filtered_df['count'].sum():,}")
+    st.metric("🚲 Total Penyewaan", f"{metrics['total']:,}")
 with col3:
-    st.metric("📊 Rata-rata/Hari", f"{filtered_df['count'].mean():.0f}")
+    st.metric("📊 Rata-rata/Hari", f"{metrics['mean']:.0f}")
 with col4:
-    st.metric("🏆 Penyewaan Tertinggi", f"{filtered_df['count'].max():,}")
+    st.metric("🏆 Penyewaan Tertinggi", f"{metrics['max']:,}")
 
 st.markdown("---")
 
@@ -190,82 +175,17 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📊 Rata-rata Penyewaan per Musim")
-    
-    # Persiapan data - SESUAI NOTEBOOK
-    seasonal_avg_rentals = filtered_df.groupby('season')['count'].mean().reset_index()
-    
-    season_order = ['spring', 'summer', 'fall', 'winter']
-    season_names_id = {'spring': 'Spring', 'summer': 'Summer', 'fall': 'Fall', 'winter': 'Winter'}
-    
-    seasonal_avg_rentals['season'] = pd.Categorical(
-        seasonal_avg_rentals['season'], 
-        categories=season_order, 
-        ordered=True
-    )
-    seasonal_avg_rentals = seasonal_avg_rentals.sort_values('season')
-    seasonal_avg_rentals['season_display'] = seasonal_avg_rentals['season'].map(season_names_id)
-    
-    # Membuat barplot - SESUAI NOTEBOOK
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = plt.cm.viridis(np.linspace(0.2, 0.9, 4))
-    bars = ax.bar(seasonal_avg_rentals['season_display'], seasonal_avg_rentals['count'], color=colors)
-    
-    ax.set_title('Rata-rata Jumlah Penyewaan Sepeda Berdasarkan Musim', fontsize=14, pad=20)
-    ax.set_xlabel('Musim', fontsize=12)
-    ax.set_ylabel('Rata-rata Jumlah Penyewaan', fontsize=12)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    # Tambahkan nilai di atas bar
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 50,
-                f'{int(height)}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('season_avg')
 
 with col2:
     st.subheader("📦 Distribusi Penyewaan per Musim")
-    
-    # Boxplot - SESUAI NOTEBOOK
-    fig, ax = plt.subplots(figsize=(10, 6))
-    
-    # Siapkan data untuk boxplot
-    plot_data = filtered_df.copy()
-    plot_data['season_display'] = pd.Categorical(
-        plot_data['season'], 
-        categories=season_order, 
-        ordered=True
-    )
-    plot_data['season_display'] = plot_data['season_display'].map(season_names_id)
-    
-    sns.boxplot(x='season_display', y='count', data=plot_data, 
-                palette='viridis', ax=ax)
-    
-    ax.set_title('Distribusi Jumlah Penyewaan Sepeda Berdasarkan Musim', fontsize=14, pad=20)
-    ax.set_xlabel('Musim', fontsize=12)
-    ax.set_ylabel('Jumlah Penyewaan', fontsize=12)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('season_box')
+    st.caption("Kuartil dihitung dari histogram per stasiun (presisi ±1%); nilai minimum dan maksimum eksak.")
 
 # Statistik per musim
 st.subheader("📋 Statistik Penyewaan per Musim")
 
-season_stats = filtered_df.groupby('season').agg({
-    'casual': 'mean',
-    'registered': 'mean',
-    'count': ['max', 'min', 'mean']
-}).round(2)
-
-season_stats.columns = ['Casual (Rata-rata)', 'Registered (Rata-rata)', 'Max', 'Min', 'Rata-rata']
-season_stats = season_stats.reindex(season_order)
-season_stats.index = [season_names_id[s] for s in season_order]
+season_stats = views['season_stats']
 
 st.dataframe(season_stats.style.background_gradient(cmap='viridis', subset=['Rata-rata']),
             use_container_width=True)
@@ -290,98 +210,16 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("🌤️ Rata-rata Penyewaan per Kondisi Cuaca")
-    
-    # Barplot cuaca - SESUAI NOTEBOOK
-    weather_avg_rentals = filtered_df.groupby('weather_condition')['count'].mean().reset_index()
-    
-    weather_order = ['clear', 'mist', 'light rain']
-    weather_names_id = {'clear': 'Clear', 'mist': 'Mist', 'light rain': 'Light Rain'}
-    
-    weather_avg_rentals['weather_condition'] = pd.Categorical(
-        weather_avg_rentals['weather_condition'], 
-        categories=weather_order, 
-        ordered=True
-    )
-    weather_avg_rentals = weather_avg_rentals.sort_values('weather_condition')
-    weather_avg_rentals['weather_display'] = weather_avg_rentals['weather_condition'].map(weather_names_id)
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(weather_avg_rentals)))
-    bars = ax.bar(weather_avg_rentals['weather_display'], weather_avg_rentals['count'], color=colors)
-    
-    ax.set_title('Rata-rata Jumlah Penyewaan Sepeda Berdasarkan Kondisi Cuaca', 
-                fontsize=14, pad=20)
-    ax.set_xlabel('Kondisi Cuaca', fontsize=12)
-    ax.set_ylabel('Rata-rata Jumlah Penyewaan', fontsize=12)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 50,
-                f'{int(height)}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('weather_avg')
 
 with col2:
     st.subheader("👥 Casual vs Registered per Kondisi Cuaca")
-    
-    # Barplot casual vs registered - SESUAI NOTEBOOK
-    weather_user = filtered_df.groupby('weather_condition')[['casual', 'registered']].mean().reset_index()
-    weather_user['weather_condition'] = pd.Categorical(
-        weather_user['weather_condition'], 
-        categories=weather_order, 
-        ordered=True
-    )
-    weather_user = weather_user.sort_values('weather_condition')
-    weather_user['weather_display'] = weather_user['weather_condition'].map(weather_names_id)
-    
-    fig, ax = plt.subplots(figsize=(12, 7))
-    
-    x = np.arange(len(weather_user))
-    width = 0.35
-    
-    bars1 = ax.bar(x - width/2, weather_user['casual'], width, 
-                   label='Casual', color='skyblue', edgecolor='black', linewidth=0.5)
-    bars2 = ax.bar(x + width/2, weather_user['registered'], width, 
-                   label='Registered', color='teal', edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Rata-rata Jumlah Penyewaan Sepeda (Casual vs Registered) Berdasarkan Kondisi Cuaca',
-                fontsize=14, pad=20)
-    ax.set_xlabel('Kondisi Cuaca', fontsize=12)
-    ax.set_ylabel('Rata-rata Jumlah Penyewaan', fontsize=12)
-    ax.set_xticks(x)
-    ax.set_xticklabels(weather_user['weather_display'])
-    ax.legend()
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    # Tambahkan nilai di atas bar
-    for bars in [bars1, bars2]:
-        for bar in bars:
-            height = bar.get_height()
-            if height > 0:
-                ax.text(bar.get_x() + bar.get_width()/2., height + 20,
-                        f'{int(height)}', ha='center', va='bottom', fontsize=9)
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('weather_user')
 
 # Tabel statistik cuaca
 st.subheader("📋 Statistik Penyewaan per Kondisi Cuaca")
 
-weather_stats = filtered_df.groupby(by='weather_condition').agg({
-    'count': ['max', 'min', 'mean', 'sum'],
-    'casual': 'mean',
-    'registered': 'mean'
-}).round(2)
-
-weather_stats.columns = ['Max', 'Min', 'Rata-rata', 'Total', 'Rata-rata Casual', 'Rata-rata Registered']
-weather_stats = weather_stats.reindex(weather_order)
-weather_stats.index = [weather_names_id[w] for w in weather_order]
+weather_stats = views['weather_stats']
 
 st.dataframe(weather_stats.style.background_gradient(cmap='YlOrRd', subset=['Rata-rata', 'Total']),
             use_container_width=True)
@@ -407,63 +245,11 @@ col1, col2 = st.columns(2)
 
 with col1:
     st.subheader("📊 Weekday vs Weekend")
-    
-    # Barplot weekday vs weekend - SESUAI NOTEBOOK
-    day_type_avg = filtered_df.groupby('day_type')['count'].mean().reset_index()
-    day_type_names = {'weekday': 'Weekday', 'weekend': 'Weekend'}
-    day_type_avg['day_display'] = day_type_avg['day_type'].map(day_type_names)
-    
-    fig, ax = plt.subplots(figsize=(8, 6))
-    colors = ['#FF6B6B', '#4ECDC4']
-    bars = ax.bar(day_type_avg['day_display'], day_type_avg['count'], color=colors, 
-                  edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Rata-rata Jumlah Penyewaan Sepeda: Hari Kerja vs Akhir Pekan',
-                fontsize=14, pad=20)
-    ax.set_xlabel('Tipe Hari', fontsize=12)
-    ax.set_ylabel('Rata-rata Jumlah Penyewaan', fontsize=12)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 20,
-                f'{int(height)}', ha='center', va='bottom', fontsize=12, fontweight='bold')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('day_type')
 
 with col2:
     st.subheader("📆 Rata-rata Penyewaan per Hari")
-    
-    # Barplot per hari
-    day_order = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-    day_names_id = {
-        'monday': 'Monday', 'tuesday': 'Tuesday', 'wednesday': 'Wednesday', 
-        'thursday': 'Thursday', 'friday': 'Friday', 'saturday': 'Saturday', 'sunday': 'Sunday'
-    }
-    
-    weekday_avg = filtered_df.groupby('weekday')['count'].mean().reset_index()
-    weekday_avg['weekday'] = pd.Categorical(weekday_avg['weekday'], categories=day_order, ordered=True)
-    weekday_avg = weekday_avg.sort_values('weekday')
-    weekday_avg['day_display'] = weekday_avg['weekday'].map(day_names_id)
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = plt.cm.Paired(np.linspace(0.1, 0.9, 7))
-    bars = ax.bar(weekday_avg['day_display'], weekday_avg['count'], color=colors,
-                  edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Rata-rata Jumlah Penyewaan Sepeda per Hari', fontsize=14, pad=20)
-    ax.set_xlabel('Hari', fontsize=12)
-    ax.set_ylabel('Rata-rata Jumlah Penyewaan', fontsize=12)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('weekday')
 
 st.info("""
 **Insight Weekday vs Weekend:**
@@ -485,50 +271,12 @@ col1, col2 = st.columns([1, 1])
 
 with col1:
     st.subheader("📊 Distribusi Segmen RFM")
-    
-    # Barplot RFM segments
-    segment_counts = filtered_df['Segment'].value_counts().reset_index()
-    segment_counts.columns = ['Segment', 'Jumlah']
-    
-    segment_order = ['Best Days', 'Good Days', 'Regular Days', 'Needs Attention', 'Lost Days']
-    segment_counts['Segment'] = pd.Categorical(segment_counts['Segment'], 
-                                              categories=segment_order, ordered=True)
-    segment_counts = segment_counts.sort_values('Segment')
-    
-    fig, ax = plt.subplots(figsize=(10, 6))
-    colors = plt.cm.viridis(np.linspace(0.2, 0.9, len(segment_counts)))
-    bars = ax.bar(segment_counts['Segment'], segment_counts['Jumlah'], color=colors,
-                  edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Distribusi Hari di Seluruh Segmen RFM', fontsize=14, pad=20)
-    ax.set_xlabel('Segmen RFM', fontsize=12)
-    ax.set_ylabel('Jumlah Hari', fontsize=12)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                f'{int(height)}', ha='center', va='bottom', fontsize=10, fontweight='bold')
-    
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('segment')
 
 with col2:
     st.subheader("📋 Detail Segmen RFM")
     
-    rfm_summary = filtered_df.groupby('Segment').agg({
-        'count': ['mean', 'min', 'max'],
-        'Recency': 'mean',
-        'R_Score': 'mean',
-        'F_Score': 'mean',
-        'M_Score': 'mean'
-    }).round(2)
-    
-    rfm_summary.columns = ['Rata-rata', 'Min', 'Max', 'Recency', 'R', 'F', 'M']
-    rfm_summary = rfm_summary.reindex(segment_order)
+    rfm_summary = views['rfm_summary']
     
     st.dataframe(
         rfm_summary.style.background_gradient(cmap='Blues', subset=['Rata-rata', 'Recency']),
@@ -556,35 +304,7 @@ col1, col2, col3 = st.columns(3)
 
 with col1:
     st.subheader("🌡️ Kategori Suhu")
-    
-    # Countplot kategori suhu - SESUAI NOTEBOOK
-    temp_counts = filtered_df['temp_category'].value_counts().reset_index()
-    temp_counts.columns = ['Kategori', 'Jumlah']
-    
-    temp_order = ['Cold', 'Mild', 'Warm', 'Hot']
-    
-    temp_counts['Kategori'] = pd.Categorical(temp_counts['Kategori'], categories=temp_order, ordered=True)
-    temp_counts = temp_counts.sort_values('Kategori')
-    
-    fig, ax = plt.subplots(figsize=(8, 5))
-    colors = ['#ADD8E6', '#90EE90', '#FFD700', '#FFA07A']
-    bars = ax.bar(temp_counts['Kategori'], temp_counts['Jumlah'], color=colors,
-                  edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Distribusi Hari Berdasarkan Kategori Suhu', fontsize=12, pad=15)
-    ax.set_xlabel('Kategori Suhu', fontsize=10)
-    ax.set_ylabel('Jumlah Hari', fontsize=10)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                f'{int(height)}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('temp_category')
     
     # Insight suhu
     st.info("""
@@ -597,37 +317,7 @@ with col1:
 
 with col2:
     st.subheader("💧 Kategori Kelembaban")
-    
-    # Countplot kategori kelembaban - SESUAI NOTEBOOK
-    hum_counts = filtered_df['hum_category'].value_counts().reset_index()
-    hum_counts.columns = ['Kategori', 'Jumlah']
-    
-    hum_order = ['Low Humidity', 'Medium Humidity', 'High Humidity']
-    hum_names = {'Low Humidity': 'Low', 'Medium Humidity': 'Medium', 'High Humidity': 'High'}
-    
-    hum_counts['Kategori'] = pd.Categorical(hum_counts['Kategori'], categories=hum_order, ordered=True)
-    hum_counts = hum_counts.sort_values('Kategori')
-    hum_counts['display'] = hum_counts['Kategori'].map(hum_names)
-    
-    fig, ax = plt.subplots(figsize=(8, 5))
-    colors = ['#87CEEB', '#4682B4', '#2E5984']
-    bars = ax.bar(hum_counts['display'], hum_counts['Jumlah'], color=colors,
-                  edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Distribusi Hari Berdasarkan Kategori Kelembaban', fontsize=12, pad=15)
-    ax.set_xlabel('Kategori Kelembaban', fontsize=10)
-    ax.set_ylabel('Jumlah Hari', fontsize=10)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                f'{int(height)}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('hum_category')
     
     # Insight kelembaban
     st.info("""
@@ -639,42 +329,7 @@ with col2:
 
 with col3:
     st.subheader("📊 Kategori Volume Penyewaan")
-    
-    # Countplot kategori volume - SESUAI NOTEBOOK
-    rental_counts = filtered_df['rental_volume_category'].value_counts().reset_index()
-    rental_counts.columns = ['Kategori', 'Jumlah']
-    
-    rental_order = ['Low Rentals', 'Medium Rentals', 'High Rentals', 'Very High Rentals']
-    rental_names = {
-        'Low Rentals': 'Rendah', 
-        'Medium Rentals': 'Sedang', 
-        'High Rentals': 'Tinggi', 
-        'Very High Rentals': 'Sangat Tinggi'
-    }
-    
-    rental_counts['Kategori'] = pd.Categorical(rental_counts['Kategori'], categories=rental_order, ordered=True)
-    rental_counts = rental_counts.sort_values('Kategori')
-    rental_counts['display'] = rental_counts['Kategori'].map(rental_names)
-    
-    fig, ax = plt.subplots(figsize=(8, 5))
-    colors = plt.cm.Reds(np.linspace(0.3, 0.9, 4))
-    bars = ax.bar(rental_counts['display'], rental_counts['Jumlah'], color=colors,
-                  edgecolor='black', linewidth=0.5)
-    
-    ax.set_title('Distribusi Hari Berdasarkan Kategori Volume Penyewaan', fontsize=12, pad=15)
-    ax.set_xlabel('Kategori Volume', fontsize=10)
-    ax.set_ylabel('Jumlah Hari', fontsize=10)
-    ax.grid(axis='y', linestyle='--', alpha=0.7)
-    ax.set_axisbelow(True)
-    
-    for bar in bars:
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height + 1,
-                f'{int(height)}', ha='center', va='bottom', fontsize=9, fontweight='bold')
-    
-    plt.tight_layout()
-    st.pyplot(fig)
-    plt.close()
+    show_chart('rental_category')
     
     # Insight volume
     st.info("""
@@ -687,6 +342,80 @@ with col3:
 
 st.markdown("---")
 
+# ============================================================================
+# SIMULASI CUACA (What-If) - Model sensitivitas cuaca per segmen
+# ============================================================================
+st.header("🔮 Simulasi Cuaca: Estimasi Permintaan per Segmen")
+st.markdown("---")
+
+# Model di-cache per versi data; saat file bertambah hanya baris baru yang diproses
+demand_store = warmup.demand_store
+demand_store.refresh()
+
+col1, col2 = st.columns([1, 2])
+
+with col1:
+    st.subheader("⚙️ Kondisi")
+    granularity = st.radio("Granularitas", options=['Harian', 'Per Jam'], horizontal=True)
+    demand_model = demand_store.models['hour' if granularity == 'Per Jam' else 'day']
+
+    sim_weather = st.selectbox("Kondisi Cuaca", options=WEATHERS,
+                               format_func=lambda x: weather_names.get(x, x))
+    sim_season = st.selectbox("Musim", options=SEASONS,
+                              format_func=lambda x: season_names.get(x, x), index=2)
+    sim_weekday = st.selectbox("Hari", options=WEEKDAYS, format_func=str.capitalize, index=1)
+    sim_hour = st.slider("Jam", 0, 23, 17) if granularity == 'Per Jam' else 0
+
+    sim_temp = st.slider("Suhu (°C)", 0.0, FEATURE_SCALE['temperature'], 20.0, step=0.5)
+    sim_atemp = st.slider("Suhu Terasa (°C)", 0.0, FEATURE_SCALE['atemp'], 24.0, step=0.5)
+    sim_hum = st.slider("Kelembaban (%)", 0.0, FEATURE_SCALE['humidity'], 60.0, step=1.0)
+    sim_wind = st.slider("Kecepatan Angin (km/jam)", 0.0, FEATURE_SCALE['windspeed'], 12.0, step=0.5)
+
+with col2:
+    st.subheader("📈 Estimasi Penyewaan")
+
+    start = time.perf_counter()
+    estimate = demand_model.predict(
+        sim_temp / FEATURE_SCALE['temperature'],
+        sim_atemp / FEATURE_SCALE['atemp'],
+        sim_hum / FEATURE_SCALE['humidity'],
+        sim_wind / FEATURE_SCALE['windspeed'],
+        sim_weather, sim_season, sim_weekday, sim_hour
+    )
+    elapsed_us = (time.perf_counter() - start) * 1e6
+
+    unit = 'jam' if granularity == 'Per Jam' else 'hari'
+    m1, m2, m3 = st.columns(3)
+    with m1:
+        st.metric(f"👤 Casual/{unit}", f"{estimate['casual']:,.0f}")
+    with m2:
+        st.metric(f"🧾 Registered/{unit}", f"{estimate['registered']:,.0f}")
+    with m3:
+        st.metric(f"🚲 Total/{unit}", f"{estimate['count']:,.0f}")
+
+    r_squared = demand_model.r_squared()
+    st.caption(
+        f"Estimasi dihitung dalam {elapsed_us:.0f} µs | "
+        f"R² casual {r_squared['casual']:.2f}, registered {r_squared['registered']:.2f}, "
+        f"total {r_squared['count']:.2f} | {demand_model.n_obs:,} baris data"
+    )
+
+    st.markdown("**Sensitivitas Cuaca (% perubahan dibanding cuaca cerah, kondisi rata-rata)**")
+    sensitivity = demand_model.weather_sensitivity()
+    sensitivity.index = [weather_names[w] for w in sensitivity.index]
+    sensitivity.columns = ['Casual', 'Registered', 'Total']
+    st.dataframe(sensitivity.style.background_gradient(cmap='RdYlGn', vmin=-60, vmax=0),
+                use_container_width=True)
+
+st.info("""
+**Catatan Model:**
+- Regresi linear per segmen (casual, registered, total) pada suhu, suhu terasa, kelembaban, kecepatan angin, cuaca, musim, hari, dan jam
+- Koefisien diselesaikan secara closed-form dari sufficient statistics sehingga data baru cukup ditambahkan tanpa fit ulang
+- Estimasi bersifat linear dan dibatasi minimal 0, gunakan sebagai gambaran arah dan besar pengaruh cuaca
+""")
+
+st.markdown("---")
+
 # ============================================================================
 # KESIMPULAN
 # ============================================================================
@@ -731,4 +460,4 @@ st.markdown("""
     <p><strong>Nama:</strong> Vania Rachmawati Dewi | <strong>Email:</strong> vaniardewi@gmail.com | <strong>ID Dicoding:</strong> vaniard</p>
     <p>© 2026 - Proyek Analisis Data</p>
 </div>
-""", unsafe_allow_html=True)
\ No newline at end of file
+""", unsafe_allow_html=True)
@@ -0,0 +1,384 @@
+import numpy as np
+import pandas as pd
+
+# Urutan kategori yang dipakai di seluruh dashboard
+season_order = ['spring', 'summer', 'fall', 'winter']
+weather_order = ['clear', 'mist', 'light rain']
+day_order = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
+day_type_order = ['weekday', 'weekend']
+month_order = ['january', 'february', 'march', 'april', 'may', 'june', 'july',
+               'august', 'september', 'october', 'november', 'december']
+segment_order = ['Best Days', 'Good Days', 'Regular Days', 'Needs Attention', 'Lost Days']
+temp_order = ['Cold', 'Mild', 'Warm', 'Hot']
+hum_order = ['Low Humidity', 'Medium Humidity', 'High Humidity']
+rental_order = ['Low Rentals', 'Medium Rentals', 'High Rentals', 'Very High Rentals']
+
+# Nama tampilan untuk setiap kategori
+season_names = {'spring': 'Spring', 'summer': 'Summer', 'fall': 'Fall', 'winter': 'Winter'}
+weather_names = {'clear': 'Clear', 'mist': 'Mist', 'light rain': 'Light Rain'}
+day_names = {
+    'monday': 'Monday', 'tuesday': 'Tuesday', 'wednesday': 'Wednesday',
+    'thursday': 'Thursday', 'friday': 'Friday', 'saturday': 'Saturday', 'sunday': 'Sunday'
+}
+day_type_names = {'weekday': 'Weekday', 'weekend': 'Weekend'}
+hum_names = {'Low Humidity': 'Low', 'Medium Humidity': 'Medium', 'High Humidity': 'High'}
+rental_names = {
+    'Low Rentals': 'Rendah',
+    'Medium Rentals': 'Sedang',
+    'High Rentals': 'Tinggi',
+    'Very High Rentals': 'Sangat Tinggi'
+}
+
+# Dataset bawaan adalah satu sistem (Capital Bikeshare) tanpa kolom stasiun
+DEFAULT_STATION = 'Capital Bikeshare'
+DEFAULT_CITY = 'Washington D.C.'
+
+# Dimensi filter dashboard; setiap partial aggregate dikunci oleh dimensi ini
+FILTER_KEYS = ['station', 'city', 'year', 'season', 'weather_condition', 'day_type']
+
+# Rasio lebar bucket histogram count (log) untuk boxplot, galat relatif < 1%
+HIST_GAMMA = 1.02
+
+# Kolom kategorikal dengan urutan kategori tetap
+CATEGORY_ORDERS = {
+    'season': season_order,
+    'month': month_order,
+    'weekday': day_order,
+    'weather_condition': weather_order,
+    'day_type': day_type_order,
+    'Segment': segment_order,
+}
+
+INTEGER_COLUMNS = ['year', 'holiday', 'workingday', 'casual', 'registered', 'count',
+                   'Recency', 'R_Score', 'F_Score', 'M_Score']
+FLOAT_COLUMNS = ['temperature', 'atemp', 'humadity']
+
+
+def compact_dtypes(df_day):
+    """Ubah kolom teks menjadi categorical berurutan tetap dan turunkan tipe numerik."""
+    for column, categories in CATEGORY_ORDERS.items():
+        if column in df_day:
+            df_day[column] = pd.Categorical(df_day[column], categories=categories, ordered=True)
+
+    for column in ['station', 'city', 'RFM_Score']:
+        if column in df_day:
+            df_day[column] = df_day[column].astype('category')
+
+    for column in INTEGER_COLUMNS:
+        if column in df_day:
+            df_day[column] = pd.to_numeric(df_day[column], downcast='integer')
+
+    for column in FLOAT_COLUMNS:
+        if column in df_day:
+            df_day[column] = df_day[column].astype(np.float32)
+
+    return df_day
+
+
+def load_day_frame(path='clean_bike_rental_day.csv', compact=True, station=DEFAULT_STATION, city=DEFAULT_CITY):
+    df_day = pd.read_csv(path)
+    df_day['dateday'] = pd.to_datetime(df_day['dateday'])
+
+    # Satu file berisi data harian satu stasiun; kolom di file diutamakan jika ada
+    if 'station' not in df_day:
+        df_day['station'] = station
+    if 'city' not in df_day:
+        df_day['city'] = city
+
+    # Hitung Recency (tanggal terbaru dalam dataset)
+    current_date = df_day['dateday'].max()
+    df_day['Recency'] = (current_date - df_day['dateday']).dt.days
+
+    # Buat R_Score (5 = paling baru, 1 = paling lama)
+    df_day['R_Score'] = pd.qcut(df_day['Recency'], 5, labels=False, duplicates='drop')
+    df_day['R_Score'] = 5 - df_day['R_Score']
+
+    # Buat F_Score dan M_Score (berdasarkan count)
+    df_day['F_Score'] = pd.qcut(df_day['count'], 5, labels=False, duplicates='drop') + 1
+    df_day['M_Score'] = pd.qcut(df_day['count'], 5, labels=False, duplicates='drop') + 1
+
+    # Buat RFM_Score gabungan
+    df_day['RFM_Score'] = df_day['R_Score'].astype(str) + df_day['F_Score'].astype(str) + df_day['M_Score'].astype(str)
+
+    # Tentukan segment (urutan kondisi sama dengan aturan RFM di notebook)
+    r_score, f_score, m_score = df_day['R_Score'], df_day['F_Score'], df_day['M_Score']
+    df_day['Segment'] = np.select(
+        [
+            (r_score >= 4) & (f_score >= 4) & (m_score >= 4),
+            (r_score >= 3) & (f_score >= 3) & (m_score >= 3),
+            (r_score >= 2) & (f_score >= 2) & (m_score >= 2),
+            (r_score <= 2) & (f_score >= 3) & (m_score >= 3),
+        ],
+        ['Best Days', 'Good Days', 'Regular Days', 'Needs Attention'],
+        default='Lost Days'
+    )
+
+    # Kategori suhu
+    df_day['temp_category'] = pd.cut(
+        df_day['temperature'],
+        bins=[0, 0.2, 0.5, 0.7, 1.0],
+        labels=temp_order,
+        include_lowest=True
+    )
+
+    # Kategori kelembaban
+    df_day['hum_category'] = pd.cut(
+        df_day['humadity'],
+        bins=[0, 0.33, 0.66, 1.0],
+        labels=hum_order,
+        include_lowest=True
+    )
+
+    # Kategori volume penyewaan
+    rental_bins = df_day['count'].quantile([0, 0.25, 0.5, 0.75, 1]).tolist()
+
+    df_day['rental_volume_category'] = pd.cut(
+        df_day['count'],
+        bins=rental_bins,
+        labels=rental_order,
+        include_lowest=True
+    )
+
+    if compact:
+        df_day = compact_dtypes(df_day)
+
+    return df_day
+
+
+
+def _bucket_value(bucket):
+    # Nilai representatif (titik tengah) setiap bucket histogram logaritmik
+    return np.expm1((bucket + 0.5) * np.log(HIST_GAMMA))
+
+
+def partial_aggregates(df_day):
+    """Ringkas frame satu stasiun menjadi partial aggregate aditif per dimensi filter.
+
+    Ukuran hasil hanya bergantung pada jumlah kombinasi kategori, bukan jumlah hari,
+    sehingga partial aggregate banyak stasiun bisa digabung dengan `merge_partials`.
+    """
+    # Jumlahkan dalam int64 agar tidak overflow pada dtype sempit
+    df_day = df_day.assign(
+        **{column: df_day[column].astype('int64') for column in
+           ['count', 'casual', 'registered', 'Recency', 'R_Score', 'F_Score', 'M_Score']},
+        count_bucket=np.floor(np.log1p(df_day['count']) / np.log(HIST_GAMMA)).astype('int64')
+    )
+
+    def cube(extra_keys, **aggs):
+        grouped = df_day.groupby(FILTER_KEYS + extra_keys, observed=True)
+        return grouped.agg(n=('count', 'size'), **aggs).reset_index()
+
+    return {
+        'base': cube(
+            [],
+            count_sum=('count', 'sum'), count_min=('count', 'min'), count_max=('count', 'max'),
+            casual_sum=('casual', 'sum'), registered_sum=('registered', 'sum')
+        ),
+        'weekday': cube(['weekday'], count_sum=('count', 'sum')),
+        'segment': cube(
+            ['Segment'],
+            count_sum=('count', 'sum'), count_min=('count', 'min'), count_max=('count', 'max'),
+            Recency_sum=('Recency', 'sum'), R_Score_sum=('R_Score', 'sum'),
+            F_Score_sum=('F_Score', 'sum'), M_Score_sum=('M_Score', 'sum')
+        ),
+        'temp_category': cube(['temp_category']),
+        'hum_category': cube(['hum_category']),
+        'rental_volume_category': cube(['rental_volume_category']),
+        'count_hist': cube(['count_bucket']),
+    }
+
+
+def _stat_agg(column):
+    if column.endswith('_min'):
+        return 'min'
+    if column.endswith('_max'):
+        return 'max'
+    return 'sum'
+
+
+def merge_partials(partials_list):
+    """Gabungkan partial aggregate beberapa shard; jumlah, min, dan max tetap aditif."""
+    merged = {}
+    for name in partials_list[0]:
+        cube = pd.concat([partials[name] for partials in partials_list], ignore_index=True)
+        for column in ['station', 'city']:
+            cube[column] = cube[column].astype('category')
+
+        stats = [c for c in cube.columns if c == 'n' or c.endswith(('_sum', '_min', '_max'))]
+        keys = [c for c in cube.columns if c not in stats]
+        merged[name] = cube.groupby(keys, observed=True).agg(
+            {column: _stat_agg(column) for column in stats}
+        ).reset_index()
+    return merged
+
+
+def select_partials(cubes, cities=None, stations=None, years=None, seasons=None, weather=None, day_type=None):
+    """Ambil baris partial aggregate yang sesuai filter sidebar (None = tanpa filter).
+
+    `stations` berisi pasangan (kota, stasiun), karena nama stasiun bisa sama di kota berbeda.
+    """
+    selected = {}
+    for name, cube in cubes.items():
+        mask = np.ones(len(cube), dtype=bool)
+        for column, values in [('city', cities), ('year', years),
+                               ('season', seasons), ('weather_condition', weather)]:
+            if values is not None:
+                mask &= cube[column].isin(values).to_numpy()
+        if stations is not None:
+            mask &= pd.MultiIndex.from_arrays([cube['city'], cube['station']]).isin(list(stations))
+        if day_type is not None:
+            mask &= (cube['day_type'] == day_type).to_numpy()
+        selected[name] = cube[mask]
+    return selected
+
+
+def _reduce(cube, key):
+    return cube.groupby(key, observed=True).agg(
+        {column: _stat_agg(column) for column in cube.columns
+         if column == 'n' or column.endswith(('_sum', '_min', '_max'))}
+    )
+
+
+def _category_counts(cube, key, categories, names=None):
+    counts = cube.groupby(key, observed=True)['n'].sum().reindex(categories, fill_value=0).reset_index()
+    counts.columns = ['Kategori', 'Jumlah']
+    counts['Kategori'] = pd.Categorical(counts['Kategori'], categories=categories, ordered=True)
+    if names is not None:
+        counts['display'] = counts['Kategori'].map(names)
+    return counts
+
+
+def _box_stats(hist, label, count_min, count_max):
+    """Statistik boxplot (kuartil, whisker 1.5 IQR, outlier) dari histogram bucket count.
+
+    Bucket terendah dan tertinggi diwakili min/max eksak seleksi, dan titik tengah bucket
+    lain dibatasi ke rentang itu, sehingga whisker tidak melewati data sebenarnya.
+    Histogram kosong menghasilkan None (tidak ada box untuk label ini).
+    """
+    if hist['n'].sum() == 0:
+        return None
+    values = _bucket_value(hist['count_bucket'].to_numpy())
+    order = np.argsort(values)
+    values = np.clip(values[order], count_min, count_max)
+    values[0], values[-1] = count_min, count_max
+    counts = hist['n'].to_numpy()[order]
+    cumulative = np.cumsum(counts)
+
+    def quantile(q):
+        # Interpolasi linear antar hari seperti np.percentile (dipakai boxplot matplotlib)
+        position = q * (cumulative[-1] - 1)
+        lower, upper = np.searchsorted(cumulative, [np.floor(position), np.ceil(position)], side='right')
+        return values[lower] + (values[upper] - values[lower]) * (position - np.floor(position))
+
+    q1, median, q3 = quantile(0.25), quantile(0.5), quantile(0.75)
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    whislo, whishi = inside.min(), inside.max()
+    return {
+        'label': label, 'med': median, 'q1': q1, 'q3': q3,
+        'whislo': whislo, 'whishi': whishi,
+        # Satu titik outlier per hari, bukan per bucket
+        'fliers': np.repeat(values, counts)[np.repeat((values < whislo) | (values > whishi), counts)],
+    }
+
+
+def build_views(cubes):
+    """Hitung seluruh tabel agregat dashboard dari partial aggregate - SESUAI NOTEBOOK."""
+    views = {}
+    base = cubes['base']
+
+    n_days = base['n'].sum()
+    views['metrics'] = {
+        'days': int(n_days),
+        'total': int(base['count_sum'].sum()),
+        'mean': base['count_sum'].sum() / n_days if n_days else np.nan,
+        'max': int(base['count_max'].max()) if n_days else 0,
+    }
+
+    # Musim
+    season = _reduce(base, 'season')
+    seasonal_avg_rentals = (season['count_sum'] / season['n']).rename('count').reset_index()
+    seasonal_avg_rentals['season_display'] = seasonal_avg_rentals['season'].map(season_names)
+    views['seasonal_avg_rentals'] = seasonal_avg_rentals
+
+    count_hist = cubes['count_hist'].groupby(['season', 'count_bucket'], observed=True)['n'].sum()
+    count_hist = count_hist[count_hist > 0].reset_index()
+    season_box = [
+        _box_stats(count_hist[count_hist['season'] == s], season_names[s],
+                   season.at[s, 'count_min'], season.at[s, 'count_max'])
+        for s in season_order if s in season.index
+    ]
+    views['season_box'] = [stats for stats in season_box if stats is not None]
+
+    season_stats = pd.DataFrame({
+        'Casual (Rata-rata)': season['casual_sum'] / season['n'],
+        'Registered (Rata-rata)': season['registered_sum'] / season['n'],
+        'Max': season['count_max'],
+        'Min': season['count_min'],
+        'Rata-rata': season['count_sum'] / season['n'],
+    }).round(2)
+    season_stats = season_stats.reindex(season_order)
+    season_stats.index = [season_names[s] for s in season_order]
+    views['season_stats'] = season_stats
+
+    # Cuaca
+    weather = _reduce(base, 'weather_condition')
+    weather_avg_rentals = (weather['count_sum'] / weather['n']).rename('count').reset_index()
+    weather_avg_rentals['weather_display'] = weather_avg_rentals['weather_condition'].map(weather_names)
+    views['weather_avg_rentals'] = weather_avg_rentals
+
+    weather_user = pd.DataFrame({
+        'casual': weather['casual_sum'] / weather['n'],
+        'registered': weather['registered_sum'] / weather['n'],
+    }).reset_index()
+    weather_user['weather_display'] = weather_user['weather_condition'].map(weather_names)
+    views['weather_user'] = weather_user
+
+    weather_stats = pd.DataFrame({
+        'Max': weather['count_max'],
+        'Min': weather['count_min'],
+        'Rata-rata': weather['count_sum'] / weather['n'],
+        'Total': weather['count_sum'],
+        'Rata-rata Casual': weather['casual_sum'] / weather['n'],
+        'Rata-rata Registered': weather['registered_sum'] / weather['n'],
+    }).round(2)
+    weather_stats = weather_stats.reindex(weather_order)
+    weather_stats.index = [weather_names[w] for w in weather_order]
+    views['weather_stats'] = weather_stats
+
+    # Hari
+    day_type = _reduce(base, 'day_type')
+    day_type_avg = (day_type['count_sum'] / day_type['n']).rename('count').reset_index()
+    day_type_avg['day_display'] = day_type_avg['day_type'].map(day_type_names)
+    views['day_type_avg'] = day_type_avg
+
+    weekday = _reduce(cubes['weekday'], 'weekday')
+    weekday_avg = (weekday['count_sum'] / weekday['n']).rename('count').reset_index()
+    weekday_avg['day_display'] = weekday_avg['weekday'].map(day_names)
+    views['weekday_avg'] = weekday_avg
+
+    # RFM
+    segment = _reduce(cubes['segment'], 'Segment')
+    segment_counts = segment['n'].reindex(segment_order, fill_value=0).reset_index()
+    segment_counts.columns = ['Segment', 'Jumlah']
+    views['segment_counts'] = segment_counts
+
+    rfm_summary = pd.DataFrame({
+        'Rata-rata': segment['count_sum'] / segment['n'],
+        'Min': segment['count_min'],
+        'Max': segment['count_max'],
+        'Recency': segment['Recency_sum'] / segment['n'],
+        'R': segment['R_Score_sum'] / segment['n'],
+        'F': segment['F_Score_sum'] / segment['n'],
+        'M': segment['M_Score_sum'] / segment['n'],
+    }).round(2)
+    views['rfm_summary'] = rfm_summary.reindex(segment_order)
+
+    # Kategorisasi
+    views['temp_counts'] = _category_counts(cubes['temp_category'], 'temp_category', temp_order)
+    views['hum_counts'] = _category_counts(cubes['hum_category'], 'hum_category', hum_order, hum_names)
+    views['rental_counts'] = _category_counts(
+        cubes['rental_volume_category'], 'rental_volume_category', rental_order, rental_names
+    )
+
+    return views
@@ -0,0 +1,16 @@
+import os
+import sys
+import threading
+
+from streamlit.web import cli as stcli
+
+from warmup import keep_warm
+
+# Launcher: warm-up dimulai saat proses server dimulai, bukan saat sesi pertama dibuka,
+# sehingga readiness probe berbasis file (DASHBOARD_READY_FILE) bisa lolos tanpa request
+if __name__ == '__main__':
+    # Warm-up yang gagal diulang di background agar readiness probe akhirnya bisa lolos
+    threading.Thread(target=keep_warm, name='warmup-retry', daemon=True).start()
+    dashboard_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dashboard.py')
+    sys.argv = ['streamlit', 'run', dashboard_path, *sys.argv[1:]]
+    sys.exit(stcli.main())
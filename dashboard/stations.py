@@ -0,0 +1,62 @@
+import glob
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from data_model import DEFAULT_CITY, DEFAULT_STATION, load_day_frame, merge_partials, partial_aggregates
+
+# Satu shard = satu file data harian untuk satu stasiun
+StationShard = namedtuple('StationShard', ['path', 'station', 'city'])
+
+
+def discover_shards(base_dir='.', default_path='clean_bike_rental_day.csv'):
+    """Cari data per stasiun di stations/<kota>/<stasiun>.csv.
+
+    Jika folder stations belum ada, dataset bawaan dipakai sebagai satu stasiun.
+    """
+    paths = sorted(glob.glob(os.path.join(base_dir, 'stations', '*', '*.csv')))
+    if not paths:
+        return [StationShard(os.path.join(base_dir, default_path), DEFAULT_STATION, DEFAULT_CITY)]
+
+    return [
+        StationShard(path, os.path.splitext(os.path.basename(path))[0], os.path.basename(os.path.dirname(path)))
+        for path in paths
+    ]
+
+
+def ingest_shard(shard):
+    """Load & feature engineering satu stasiun, lalu kembalikan partial aggregate saja."""
+    df_day = load_day_frame(shard.path, station=shard.station, city=shard.city)
+    return {
+        'partials': partial_aggregates(df_day),
+        'date_min': df_day['dateday'].min(),
+        'date_max': df_day['dateday'].max(),
+    }
+
+
+def ingest_stations(shards, max_workers=None):
+    """Ingest seluruh shard di worker process dan gabungkan partial aggregate-nya.
+
+    Frame per hari tidak pernah dikirim balik ke proses utama, sehingga memori
+    proses dashboard hanya sebesar partial aggregate yang sudah digabung.
+    """
+    if max_workers is None:
+        max_workers = min(len(shards), os.cpu_count() or 1)
+
+    if max_workers <= 1:
+        results = [ingest_shard(shard) for shard in shards]
+    else:
+        # spawn: server Streamlit multi-thread, fork dari proses seperti itu tidak aman
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            chunksize = max(1, len(shards) // (max_workers * 4))
+            results = list(executor.map(ingest_shard, shards, chunksize=chunksize))
+
+    cubes = merge_partials([result['partials'] for result in results])
+    return {
+        'cubes': cubes,
+        'stations': cubes['base'][['city', 'station']].drop_duplicates().sort_values(['city', 'station']),
+        'date_min': min(result['date_min'] for result in results),
+        'date_max': max(result['date_max'] for result in results),
+    }
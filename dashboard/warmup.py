@@ -0,0 +1,118 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from charts import CHARTS, render_png
+from data_model import build_views
+from stations import discover_shards, ingest_stations
+from weather_model import DemandModelStore
+
+DASHBOARD_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class DashboardWarmup:
+    """Menyiapkan data stasiun, agregat, dan chart tampilan default di background thread.
+
+    Setiap tahap disimpan sebagai Future sehingga dashboard bisa langsung tampil
+    dan memakai hasil yang sudah siap, sementara sisanya masih dikerjakan.
+    """
+
+    def __init__(self, shards, demand_store=None, max_workers=4, ready_file=None):
+        self.ready = threading.Event()
+        self.ready_file = ready_file
+        self.demand_store = demand_store
+        self._lock = threading.Lock()
+        self._done = 0
+        self._failed = 0
+        # data + views + satu tahap per chart (+ model what-if jika ada)
+        self._total = 2 + len(CHARTS) + (1 if demand_store is not None else 0)
+        # Penanda dari proses sebelumnya tidak boleh membuat probe lolos sebelum warm-up selesai
+        if ready_file and os.path.exists(ready_file):
+            os.remove(ready_file)
+
+        # Tahap dikirim berurutan (FIFO), sehingga tahap yang menunggu tahap
+        # sebelumnya tidak akan deadlock walaupun worker terbatas
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='warmup')
+        # Ingest per stasiun berjalan di process pool milik ingest_stations
+        self.data = self._submit(ingest_stations, shards)
+        self.model = self._submit(demand_store.refresh) if demand_store is not None else None
+        self.views = self._submit(lambda: build_views(self.data.result()['cubes']))
+        self.charts = {
+            name: self._submit(lambda chart=chart: render_png(chart(self.views.result())))
+            for name, chart in CHARTS.items()
+        }
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, func, *args):
+        future = self._executor.submit(func, *args)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        with self._lock:
+            self._done += 1
+            if future.exception() is not None:
+                self._failed += 1
+            # Siap hanya jika semua tahap selesai tanpa error
+            finished = self._done == self._total and self._failed == 0
+        if finished:
+            if self.ready_file:
+                # Penanda untuk readiness probe (mis. `test -f <ready_file>`)
+                with open(self.ready_file, 'w') as f:
+                    f.write('ready\n')
+            self.ready.set()
+
+    @property
+    def done(self):
+        """True jika semua tahap warm-up sudah selesai (berhasil maupun gagal)."""
+        with self._lock:
+            return self._done == self._total
+
+    @property
+    def failed(self):
+        """True jika ada tahap warm-up yang gagal."""
+        with self._lock:
+            return self._failed > 0
+
+    @property
+    def progress(self):
+        """Rasio tahap warm-up yang sudah selesai (0-1)."""
+        with self._lock:
+            return self._done / self._total
+
+    def chart_png(self, name):
+        """PNG chart default jika sudah selesai atau sedang dirender, selain itu None."""
+        future = self.charts.get(name)
+        # Chart yang masih antre lebih cepat dirender langsung oleh sesi
+        if future is None or not (future.done() or future.running()):
+            return None
+        if future.exception() is not None:
+            return None
+        return future.result()
+
+
+# Satu warm-up per proses server, dipakai bersama oleh launcher dan semua sesi
+_warmup = None
+_warmup_lock = threading.Lock()
+
+
+def start_warmup(base_dir=DASHBOARD_DIR):
+    """Mulai warm-up jika belum berjalan di proses ini dan kembalikan instance-nya.
+
+    Warm-up yang sudah selesai tetapi ada tahap yang gagal dibuang lalu dimulai ulang.
+    """
+    global _warmup
+    with _warmup_lock:
+        if _warmup is None or (_warmup.done and _warmup.failed):
+            _warmup = DashboardWarmup(
+                discover_shards(base_dir),
+                demand_store=DemandModelStore(),
+                ready_file=os.environ.get('DASHBOARD_READY_FILE')
+            )
+        return _warmup
+
+
+def keep_warm(retry_interval=30):
+    """Ulangi warm-up yang gagal sampai siap, tanpa menunggu ada sesi yang dibuka."""
+    while not start_warmup().ready.wait(retry_interval):
+        pass
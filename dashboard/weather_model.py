@@ -0,0 +1,214 @@
+import copy
+import hashlib
+import io
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+
+# Lokasi dataset mentah (day.csv & hour.csv) relatif terhadap folder dashboard
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+SEGMENTS = ['casual', 'registered', 'count']
+
+# Urutan kategori mengikuti dashboard; kategori pertama menjadi baseline model
+SEASONS = ['spring', 'summer', 'fall', 'winter']
+WEATHERS = ['clear', 'mist', 'light rain']
+WEEKDAYS = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']
+HOURS = list(range(24))
+
+NUMERIC_FEATURES = ['temperature', 'atemp', 'humidity', 'windspeed']
+
+# Faktor normalisasi dataset UCI (temp/41, atemp/50, hum/100, windspeed/67)
+FEATURE_SCALE = {'temperature': 41.0, 'atemp': 50.0, 'humidity': 100.0, 'windspeed': 67.0}
+
+
+class WeatherDemandModel:
+    """Regresi linear per segmen (casual, registered, count) dengan solusi closed-form.
+
+    Model hanya menyimpan sufficient statistics (X'X, X'Y, Y'Y, n), sehingga data
+    baru cukup ditambahkan lewat `partial_fit` tanpa perlu fit ulang dari awal.
+    """
+
+    def __init__(self, hourly=False):
+        self.hourly = hourly
+        self.feature_names = (
+            ['intercept'] + NUMERIC_FEATURES
+            + [f'weather_{w}' for w in WEATHERS[1:]]
+            + [f'season_{s}' for s in SEASONS[1:]]
+            + [f'weekday_{d}' for d in WEEKDAYS[1:]]
+            + ([f'hour_{h}' for h in HOURS[1:]] if hourly else [])
+        )
+        p = len(self.feature_names)
+        k = len(SEGMENTS)
+
+        self.n_obs = 0
+        self._xtx = np.zeros((p, p))
+        self._xty = np.zeros((p, k))
+        self._yty = np.zeros(k)
+        self._ysum = np.zeros(k)
+
+        # Offset blok dummy di dalam vektor fitur
+        self._weather_offset = 1 + len(NUMERIC_FEATURES)
+        self._season_offset = self._weather_offset + len(WEATHERS) - 1
+        self._weekday_offset = self._season_offset + len(SEASONS) - 1
+        self._hour_offset = self._weekday_offset + len(WEEKDAYS) - 1
+
+        self._beta = None
+        self._beta_n_obs = -1
+
+    def _design_matrix(self, raw):
+        n = len(raw)
+        X = np.zeros((n, len(self.feature_names)))
+        X[:, 0] = 1.0
+        X[:, 1:1 + len(NUMERIC_FEATURES)] = raw[['temp', 'atemp', 'hum', 'windspeed']].to_numpy(dtype=float)
+
+        rows = np.arange(n)
+        # Kode mentah: season 1-4, weathersit 1-4 (4 = hujan lebat digabung ke light rain),
+        # weekday 0-6 (0 = sunday), hr 0-23. Kode 0 adalah baseline tanpa kolom dummy.
+        codes = [
+            (np.minimum(raw['weathersit'].to_numpy(), len(WEATHERS)) - 1, self._weather_offset),
+            (raw['season'].to_numpy() - 1, self._season_offset),
+            (raw['weekday'].to_numpy(), self._weekday_offset),
+        ]
+        if self.hourly:
+            codes.append((raw['hr'].to_numpy(), self._hour_offset))
+
+        for code, offset in codes:
+            mask = code > 0
+            X[rows[mask], offset + code[mask] - 1] = 1.0
+        return X
+
+    def partial_fit(self, raw):
+        """Tambahkan baris baru (format day.csv / hour.csv) ke sufficient statistics."""
+        if len(raw) == 0:
+            return self
+        X = self._design_matrix(raw)
+        Y = raw[['casual', 'registered', 'cnt']].to_numpy(dtype=float)
+
+        self._xtx += X.T @ X
+        self._xty += X.T @ Y
+        self._yty += (Y * Y).sum(axis=0)
+        self._ysum += Y.sum(axis=0)
+        self.n_obs += len(raw)
+        return self
+
+    @property
+    def beta(self):
+        # Solusi hanya dihitung ulang jika ada data baru sejak solve terakhir
+        if self._beta_n_obs != self.n_obs:
+            self._beta = np.linalg.lstsq(self._xtx, self._xty, rcond=None)[0]
+            self._beta_n_obs = self.n_obs
+        return self._beta
+
+    def coefficients(self):
+        return pd.DataFrame(self.beta, index=self.feature_names, columns=SEGMENTS)
+
+    def r_squared(self):
+        beta = self.beta
+        sse = self._yty - 2 * (beta * self._xty).sum(axis=0) + np.einsum('ik,ij,jk->k', beta, self._xtx, beta)
+        sst = self._yty - self._ysum ** 2 / max(self.n_obs, 1)
+        return dict(zip(SEGMENTS, 1 - sse / np.where(sst > 0, sst, 1)))
+
+    def predict(self, temperature, atemp, humidity, windspeed, weather, season, weekday, hour=0):
+        """Estimasi penyewaan per segmen untuk satu kondisi (fitur numerik ternormalisasi 0-1)."""
+        beta = self.beta
+        y = beta[0] + np.array([temperature, atemp, humidity, windspeed]) @ beta[1:self._weather_offset]
+
+        w = WEATHERS.index(weather)
+        s = SEASONS.index(season)
+        d = WEEKDAYS.index(weekday)
+        if w:
+            y = y + beta[self._weather_offset + w - 1]
+        if s:
+            y = y + beta[self._season_offset + s - 1]
+        if d:
+            y = y + beta[self._weekday_offset + d - 1]
+        if self.hourly and hour:
+            y = y + beta[self._hour_offset + hour - 1]
+
+        return dict(zip(SEGMENTS, np.maximum(y, 0.0)))
+
+    def weather_sensitivity(self):
+        """Perubahan (%) estimasi tiap segmen terhadap cuaca cerah pada kondisi rata-rata."""
+        beta = self.beta
+        n = max(self.n_obs, 1)
+        # Rata-rata fitur diambil dari baris intercept X'X (= jumlah tiap fitur),
+        # lalu dummy cuaca dinolkan agar baseline adalah kondisi cerah
+        mean_features = self._xtx[0] / n
+        mean_features[self._weather_offset:self._season_offset] = 0.0
+        baseline = mean_features @ beta
+        weather_effect = beta[self._weather_offset:self._season_offset]
+
+        sensitivity = pd.DataFrame(
+            weather_effect / np.where(baseline > 0, baseline, 1) * 100,
+            index=WEATHERS[1:],
+            columns=SEGMENTS
+        )
+        return sensitivity.round(1)
+
+
+class DemandModelStore:
+    """Menyimpan model harian & per jam dan hanya membaca baris baru saat file bertambah.
+
+    Isi file yang sudah diproses disidik dengan hash; jika berubah (file ditulis
+    ulang, bukan ditambah), statistik model di-reset lalu dihitung dari awal.
+    """
+
+    def __init__(self, data_dir=DATA_DIR):
+        self.sources = {
+            'day': os.path.join(data_dir, 'day.csv'),
+            'hour': os.path.join(data_dir, 'hour.csv'),
+        }
+        self.models = {name: WeatherDemandModel(hourly=(name == 'hour')) for name in self.sources}
+        self._rows_seen = {name: 0 for name in self.sources}
+        self._file_stat = {name: None for name in self.sources}
+        # Jumlah byte yang sudah diproses dan hash-nya, untuk mendeteksi file ditulis ulang
+        self._bytes_seen = {name: 0 for name in self.sources}
+        self._digest = {name: hashlib.sha1(b'').hexdigest() for name in self.sources}
+        self._lock = threading.Lock()
+
+    @property
+    def version(self):
+        return tuple(sorted((name, self._rows_seen[name], self._digest[name]) for name in self.sources))
+
+    def refresh(self):
+        """Sinkronkan model dengan file data; kembalikan versi data terbaru."""
+        with self._lock:
+            for name, path in self.sources.items():
+                stat = os.stat(path)
+                file_stat = (stat.st_mtime_ns, stat.st_size)
+                if file_stat == self._file_stat[name]:
+                    continue
+
+                # Baca sekali agar hash dan parsing memakai isi file yang sama
+                with open(path, 'rb') as f:
+                    content = f.read()
+                # Baris terakhir yang belum diakhiri newline mungkin masih ditulis, proses nanti
+                content = content[:content.rfind(b'\n') + 1]
+
+                consumed = self._bytes_seen[name]
+                model = self.models[name]
+                rows_seen = self._rows_seen[name]
+                if (len(content) < consumed or
+                        hashlib.sha1(content[:consumed]).hexdigest() != self._digest[name]):
+                    # File ditulis ulang (bukan ditambah), statistik lama tidak lagi valid
+                    model = WeatherDemandModel(hourly=(name == 'hour'))
+                    rows_seen = 0
+                else:
+                    # Fit pada salinan; model tersimpan hanya diganti jika parse & solve berhasil
+                    model = copy.deepcopy(model)
+
+                new_rows = pd.read_csv(io.BytesIO(content), skiprows=range(1, rows_seen + 1))
+                # Baris dengan nilai kosong dilewati agar tidak merusak sufficient statistics
+                model.partial_fit(new_rows.dropna())
+                # Solve sekali per versi data agar estimasi what-if tidak menunggu solve
+                model.beta
+
+                self.models[name] = model
+                self._rows_seen[name] = rows_seen + len(new_rows)
+                self._bytes_seen[name] = len(content)
+                self._digest[name] = hashlib.sha1(content).hexdigest()
+                self._file_stat[name] = file_stat
+            return self.version